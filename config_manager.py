@@ -6,9 +6,28 @@
 
 import json
 import os
-import copy
 from pathlib import Path
 
+# 可选依赖：orjson解析/序列化更快，未安装时回退到标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _loads(data):
+        return orjson.loads(data)
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(data):
+        return json.loads(data)
+    
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 # 默认配置
 DEFAULT_CONFIG = {
@@ -44,6 +63,62 @@ DEFAULT_CONFIG = {
     }
 }
 
+# 默认配置的序列化模板，用于快速生成互不共享的默认配置副本
+_DEFAULT_BLOB = json.dumps(DEFAULT_CONFIG).encode('utf-8')
+
+# 已解析配置的缓存，键为(路径, 修改时间, 文件大小)
+_CONFIG_CACHE = {}
+
+
+def _fast_clone(obj):
+    """
+    深拷贝仅由dict/list/基本类型组成的配置对象
+
+    比copy.deepcopy更快（无类型分派和memo表），基本类型不可变，直接返回即可
+    """
+    if type(obj) is dict:
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_fast_clone(v) for v in obj]
+    return obj
+
+
+def _fresh_defaults():
+    """从序列化模板生成一份全新的默认配置"""
+    return _loads(_DEFAULT_BLOB)
+
+
+def _stat_key(path):
+    """根据文件状态生成缓存键"""
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _cache_put(key, config):
+    """写入缓存，并丢弃同一路径下已过期的条目"""
+    for stale in [k for k in _CONFIG_CACHE if k[0] == key[0]]:
+        del _CONFIG_CACHE[stale]
+    _CONFIG_CACHE[key] = _fast_clone(config)
+
+
+def _write_json(path, config):
+    """
+    将配置原子地写入JSON文件
+    
+    先一次性序列化并写入临时文件，再用os.replace替换目标文件，
+    避免写入中途失败导致配置文件损坏
+    """
+    data = _dumps(config)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
 
 class ConfigManager:
     """配置管理器类"""
@@ -60,23 +135,46 @@ class ConfigManager:
         else:
             self.config_path = Path(config_path)
         
-        self.config = self._load_config()
+        # 配置在首次访问时才从文件加载
+        self._config = None
+    
+    @property
+    def config(self):
+        """当前配置（首次访问时加载）"""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value):
+        self._config = value
     
     def _load_config(self):
         """从config.json加载配置，不存在则创建默认配置"""
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                # 文件未变化时直接使用缓存结果
+                key = _stat_key(self.config_path)
+                if key in _CONFIG_CACHE:
+                    return _fast_clone(_CONFIG_CACHE[key])
+                
+                with open(self.config_path, 'rb') as f:
+                    config = _loads(f.read())
                 # 合并默认配置和加载的配置（以加载的为准）
-                return self._merge_config(DEFAULT_CONFIG, config)
+                # 已包含全部默认项时合并结果与加载的配置相同，可直接使用
+                if self._is_complete(DEFAULT_CONFIG, config):
+                    merged = config
+                else:
+                    merged = self._merge_config(DEFAULT_CONFIG, config)
+                _cache_put(key, merged)
+                return merged
             except Exception as e:
                 print(f"加载配置文件失败: {e}，使用默认配置")
-                return DEFAULT_CONFIG.copy()
+                return _fresh_defaults()
         else:
             # 创建默认配置文件
             self.save_config(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG.copy()
+            return _fresh_defaults()
     
     def _merge_config(self, default, loaded):
         """
@@ -89,14 +187,33 @@ class ConfigManager:
         Returns:
             合并后的配置
         """
-        result = copy.deepcopy(default)
+        result = _fast_clone(default)
         for key, value in loaded.items():
             if isinstance(value, dict) and key in result and isinstance(result[key], dict):
                 result[key] = self._merge_config(result[key], value)
             else:
-                result[key] = copy.deepcopy(value)
+                result[key] = _fast_clone(value)
         return result
     
+    def _is_complete(self, default, loaded):
+        """
+        检查加载的配置是否已包含默认配置的全部键
+        
+        Args:
+            default: 默认配置
+            loaded: 加载的配置
+            
+        Returns:
+            包含全部键返回True，否则返回False
+        """
+        for key, value in default.items():
+            if key not in loaded:
+                return False
+            if isinstance(value, dict) and isinstance(loaded[key], dict):
+                if not self._is_complete(value, loaded[key]):
+                    return False
+        return True
+    
     def get_config(self):
         """获取完整配置"""
         return self.config
@@ -124,8 +241,12 @@ class ConfigManager:
             # 确保目录存在
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _write_json(self.config_path, config)
+            
+            # 以写入后的文件状态更新缓存（与重新加载时的合并结果保持一致）
+            if not self._is_complete(DEFAULT_CONFIG, config):
+                config = self._merge_config(DEFAULT_CONFIG, config)
+            _cache_put(_stat_key(self.config_path), config)
             return True
         except Exception as e:
             print(f"保存配置文件失败: {e}")
@@ -145,8 +266,7 @@ class ConfigManager:
             export_path = Path(export_path)
             export_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            _write_json(export_path, self.config)
             return True
         except Exception as e:
             print(f"导出配置失败: {e}")
@@ -168,8 +288,8 @@ class ConfigManager:
                 print(f"配置文件不存在: {import_path}")
                 return False
             
-            with open(import_path, 'r', encoding='utf-8') as f:
-                imported_config = json.load(f)
+            with open(import_path, 'rb') as f:
+                imported_config = _loads(f.read())
             
             # 合并导入的配置和默认配置
             self.config = self._merge_config(DEFAULT_CONFIG, imported_config)
@@ -183,6 +303,6 @@ class ConfigManager:
     
     def reset_config(self):
         """重置为默认配置"""
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = _fresh_defaults()
         self.save_config(self.config)
         return True
@@ -1,8 +1,54 @@
+import io
+import os
 import re
 import statistics
+import sys
+import warnings
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+
+# 元数据解析表：(行内标识, 预编译正则, 元数据键, 类型转换)
+_META_PATTERNS = (
+    ('Init E (V)', re.compile(r'Init E \(V\)\s*=\s*([-\d.]+)'), 'init_e', float),
+    ('High E (V)', re.compile(r'High E \(V\)\s*=\s*([-\d.]+)'), 'high_e', float),
+    ('Low E (V)', re.compile(r'Low E \(V\)\s*=\s*([-\d.]+)'), 'low_e', float),
+    ('Scan Rate (V/s)', re.compile(r'Scan Rate \(V/s\)\s*=\s*([\d.e-]+)'), 'scan_rate', float),
+    ('Segment', re.compile(r'Segment\s*=\s*(\d+)'), 'segment', int),
+    ('Sample Interval (V)', re.compile(r'Sample Interval \(V\)\s*=\s*([\d.e-]+)'), 'sample_interval', float),
+    ('Sensitivity (A/V)', re.compile(r'Sensitivity \(A/V\)\s*=\s*([\d.e-]+)'), 'sensitivity', float),
+)
+
+# 已解析文件的LRU缓存：(路径, 修改时间, 文件大小) -> (元数据, 只读的(N, 2)数据数组)
+_CV_PARSE_CACHE = OrderedDict()
+_CV_PARSE_CACHE_SIZE = 8
+
+# 检查CV实验标识时读取的文件头部长度（字符数）
+_HEAD_SIZE = 8192
+
+# 数据段的标题行标识
+_DATA_HEADER = 'Potential/V, Current/A'
+
+# 循环结果的结构化数组类型，outlier_reason等字符串仍只保存在结果字典中
+_RESULT_DTYPE = np.dtype([
+    ('cycle_num', 'i4'),
+    ('area', 'f8'),
+    ('capacitance', 'f8'),
+    ('is_outlier', '?'),
+])
+
+
+def _file_cache_key(file_path: str) -> Optional[Tuple]:
+    """根据文件状态生成缓存键，无法获取文件状态时返回None"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
 
 class CVAnalyzer:
     """分析CHI660E电化学工作站导出的循环伏安数据"""
@@ -19,22 +65,75 @@ class CVAnalyzer:
         self.outlier_count = outlier_count
         self.file_path = None
         self.metadata = {}
-        self.voltage_current_data = []
+        # 数据以列存储：_samples为(N, 2)的float64数组，voltages/currents为其列视图
+        self._samples = np.empty((0, 2), dtype=np.float64)
+        self.voltages = self._samples[:, 0]
+        self.currents = self._samples[:, 1]
+        self._voltage_current_list = None
         self.is_cv = False
+    
+    @property
+    def voltage_current_data(self) -> List[Tuple[float, float]]:
+        """[(voltage, current)]列表形式的数据（兼容旧接口，首次访问时生成）"""
+        if self._voltage_current_list is None:
+            self._voltage_current_list = list(zip(self.voltages.tolist(), self.currents.tolist()))
+        return self._voltage_current_list
         
     def read_file(self, file_path: str) -> bool:
         """
         读入数据文件
         
+        以缓冲方式单次扫描文件：先在文件头部中定位数据开始行并解析元数据，
+        其后的数据行交由numpy一次性解析
+        
         Args:
             file_path: 文件路径
             
         Returns:
             True if successful, False otherwise
         """
+        # 文件未变化时直接使用缓存的解析结果
+        cache_key = _file_cache_key(file_path)
+        cached = _CV_PARSE_CACHE.get(cache_key) if cache_key else None
+        if cached is not None:
+            _CV_PARSE_CACHE.move_to_end(cache_key)
+            metadata, samples = cached
+            self.metadata.update(metadata)
+            self._set_samples(samples)
+            self.file_path = file_path
+            self.is_cv = True
+            return True
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                # 检查是否为CV实验（标识位于文件头部），不是则无需继续读取
+                head = f.read(_HEAD_SIZE)
+                found_cv = "Cyclic Voltammetry" in head
+                
+                if found_cv:
+                    # 补齐被截断的最后一行，使文件位置落在行首
+                    head += f.readline()
+                    
+                    # 定位数据开始行，文件头较长时继续逐行查找
+                    pos = head.find(_DATA_HEADER)
+                    while pos < 0:
+                        line = f.readline()
+                        if not line:
+                            break
+                        if _DATA_HEADER in line:
+                            pos = len(head) + line.find(_DATA_HEADER)
+                        head += line
+                    
+                    # 解析元数据（通常在前50行）
+                    header_end = pos if pos >= 0 else len(head)
+                    for line in head[:header_end].split('\n')[:50]:
+                        self._parse_metadata_line(line)
+                    
+                    # 解析电压-电流数据：头部中剩余的数据行 + 文件其余部分
+                    if pos >= 0:
+                        data_start = head.find('\n', pos) + 1
+                        head_rest = head[data_start:] if data_start > 0 else ''
+                        self._parse_voltage_current_data(head_rest, f)
         except Exception as e:
             print(f"错误：无法读取文件 {file_path}")
             print(f"详情：{e}")
@@ -42,102 +141,117 @@ class CVAnalyzer:
         
         self.file_path = file_path
         
-        # 检查是否为CV实验
-        if "Cyclic Voltammetry" not in content:
+        if not found_cv:
             print("错误：文件不包含'Cyclic Voltammetry'字样，可能不是CV实验数据")
             return False
         
         self.is_cv = True
         
-        # 解析元数据
-        self._parse_metadata(content)
-        
-        # 解析电压-电流数据
-        self._parse_voltage_current_data(content)
-        
-        if not self.voltage_current_data:
+        if self.voltages.size == 0:
             print("错误：未找到电压-电流数据")
             return False
         
+        if cache_key:
+            # 数据数组设为只读后与缓存共享，无需复制
+            self._samples.flags.writeable = False
+            _CV_PARSE_CACHE[cache_key] = (dict(self.metadata), self._samples)
+            if len(_CV_PARSE_CACHE) > _CV_PARSE_CACHE_SIZE:
+                _CV_PARSE_CACHE.popitem(last=False)
+        
         return True
     
-    def _parse_metadata(self, content: str) -> None:
-        """从文件内容中提取元数据"""
-        lines = content.split('\n')
-        
-        for line in lines[:50]:  # 元数据通常在前50行
-            # 解析初始电压
-            if 'Init E (V)' in line:
-                match = re.search(r'Init E \(V\)\s*=\s*([-\d.]+)', line)
-                if match:
-                    self.metadata['init_e'] = float(match.group(1))
-            
-            # 解析最高电压
-            if 'High E (V)' in line:
-                match = re.search(r'High E \(V\)\s*=\s*([-\d.]+)', line)
-                if match:
-                    self.metadata['high_e'] = float(match.group(1))
-            
-            # 解析最低电压
-            if 'Low E (V)' in line:
-                match = re.search(r'Low E \(V\)\s*=\s*([-\d.]+)', line)
-                if match:
-                    self.metadata['low_e'] = float(match.group(1))
-            
-            # 解析扫速
-            if 'Scan Rate (V/s)' in line:
-                match = re.search(r'Scan Rate \(V/s\)\s*=\s*([\d.e-]+)', line)
+    def _parse_metadata_line(self, line: str) -> None:
+        """从单行文件头中提取元数据"""
+        for token, pattern, key, caster in _META_PATTERNS:
+            if token in line:
+                match = pattern.search(line)
                 if match:
-                    self.metadata['scan_rate'] = float(match.group(1))
-            
-            # 解析段数
-            if 'Segment' in line and '=' in line:
-                match = re.search(r'Segment\s*=\s*(\d+)', line)
-                if match:
-                    self.metadata['segment'] = int(match.group(1))
-            
-            # 解析采样间隔
-            if 'Sample Interval (V)' in line:
-                match = re.search(r'Sample Interval \(V\)\s*=\s*([\d.e-]+)', line)
-                if match:
-                    self.metadata['sample_interval'] = float(match.group(1))
-            
-            # 解析灵敏度
-            if 'Sensitivity (A/V)' in line:
-                match = re.search(r'Sensitivity \(A/V\)\s*=\s*([\d.e-]+)', line)
-                if match:
-                    self.metadata['sensitivity'] = float(match.group(1))
+                    self.metadata[key] = caster(match.group(1))
+                    break
+    
+    def _parse_voltage_current_data(self, head_rest: str, f) -> None:
+        """
+        提取电压-电流数据
+        
+        Args:
+            head_rest: 已读入的文件头部中位于数据开始行之后的内容
+            f: 位于行首的文本文件对象，其后为剩余的数据行
+        """
+        head_samples = self._load_samples(io.StringIO(head_rest))
+        tail_samples = self._load_samples(f)
+        
+        if head_samples.shape[0] == 0:
+            samples = tail_samples
+        elif tail_samples.shape[0] == 0:
+            samples = head_samples
+        else:
+            samples = np.concatenate((head_samples, tail_samples))
+        
+        self._set_samples(samples)
     
-    def _parse_voltage_current_data(self, content: str) -> None:
-        """从文件内容中提取电压-电流数据"""
-        # 找到数据开始行 "Potential/V, Current/A"
-        lines = content.split('\n')
-        data_start_idx = -1
-        
-        for i, line in enumerate(lines):
-            if 'Potential/V, Current/A' in line:
-                data_start_idx = i + 1
-                break
-        
-        if data_start_idx == -1:
-            return
-        
-        # 提取数据行
-        for line in lines[data_start_idx:]:
-            line = line.strip()
-            if not line:
-                continue
+    def _load_samples(self, f) -> np.ndarray:
+        """
+        从文本流当前位置起解析(N, 2)电压-电流数组
+        
+        优先使用numpy.loadtxt一次性解析；若存在无法解析的行则回退到逐行解析
+        
+        Args:
+            f: 支持tell/seek的文本流
             
-            # 尝试解析电压-电流对
-            try:
-                parts = line.split(',')
-                if len(parts) == 2:
-                    voltage = float(parts[0].strip())
-                    current = float(parts[1].strip())
-                    self.voltage_current_data.append((voltage, current))
-            except ValueError:
-                # 跳过无法解析的行
-                pass
+        Returns:
+            (N, 2)的float64数组
+        """
+        data_pos = f.tell()
+        
+        try:
+            with warnings.catch_warnings():
+                # 数据段为空时loadtxt会发出警告，由下方的列数检查处理
+                warnings.simplefilter('ignore', UserWarning)
+                samples = np.loadtxt(f, delimiter=',', dtype=np.float64, comments=None, ndmin=2)
+            if samples.shape[1] != 2:
+                raise ValueError("数据列数不为2")
+        except ValueError:
+            f.seek(data_pos)
+            # 逐行写入预分配的缓冲区，容量不足时加倍
+            buf = np.empty((1024, 2), dtype=np.float64)
+            n = 0
+            for pair in map(self._parse_data_line, f):
+                if pair is None:
+                    continue
+                if n == buf.shape[0]:
+                    grown = np.empty((n * 2, 2), dtype=np.float64)
+                    grown[:n] = buf
+                    buf = grown
+                buf[n] = pair
+                n += 1
+            samples = buf[:n]
+        
+        return samples
+    
+    def _set_samples(self, samples: np.ndarray) -> None:
+        """设置(N, 2)的电压-电流数组"""
+        self._samples = samples
+        self.voltages = samples[:, 0]
+        self.currents = samples[:, 1]
+        self._voltage_current_list = None
+    
+    def _parse_data_line(self, line: str) -> Optional[Tuple[float, float]]:
+        """解析单行电压-电流数据，无法解析时返回None"""
+        line = line.strip()
+        if not line:
+            return None
+        
+        # 尝试解析电压-电流对
+        try:
+            parts = line.split(',')
+            if len(parts) == 2:
+                voltage = float(parts[0].strip())
+                current = float(parts[1].strip())
+                return (voltage, current)
+        except ValueError:
+            # 跳过无法解析的行
+            pass
+        return None
     
     def analyze(self) -> bool:
         """执行分析"""
@@ -145,157 +259,153 @@ class CVAnalyzer:
             print("错误：未识别为CV实验")
             return False
         
-        if not self.voltage_current_data:
+        if self.voltages.size == 0:
             print("错误：没有可用的数据")
             return False
         
-        print("="*70)
-        print("CV数据分析结果")
-        print("="*70)
-        print()
-        
-        # 打印元数据
-        self._print_metadata()
-        print()
-        
-        # 分割数据为多个循环
-        cycles = self._split_into_cycles()
-        
-        if not cycles:
-            print("错误：无法分割循环数据")
-            return False
-        
-        print(f"识别到 {len(cycles)} 轮循环")
-        print()
-        
-        # 计算每个循环的电容
-        capacitances = []
-        cycle_results = []
-        
-        for cycle_num, cycle_data in enumerate(cycles, 1):
-            result = self._calculate_cycle_capacitance(cycle_num, cycle_data)
-            if result is not None:
-                capacitances.append(result['capacitance'])
-                cycle_results.append(result)
-        
-        # 打印每个循环的结果
-        print("各循环的计算结果：")
-        print("-"*70)
-        for result in cycle_results:
-            print(f"循环 {result['cycle_num']}:")
-            print(f"  面积 (Area): {result['area']:.6e} C")
-            print(f"  电容 (Capacitance): {result['capacitance']:.6e} F = {result['capacitance']*1000:.6f} mF")
-            if result['warning']:
-                print(f"  警告: {result['warning']}")
-            print()
-        
-        if not capacitances:
-            print("错误：所有循环都因超出灵敏度范围被忽略")
-            return False
-        
-        # 计算平均值（排除最离群值）
-        avg_capacitance = self._calculate_robust_average(capacitances)
-        
-        print("="*70)
-        print("最终结果：")
-        print("-"*70)
-        print(f"有效循环数: {len(capacitances)}")
-        print(f"被排除的离群值个数: {self.outlier_count}")
-        if len(capacitances) > 1:
-            print(f"平均电容值: {avg_capacitance:.6e} F = {avg_capacitance*1000:.6f} mF")
-            print(f"最小值: {min(capacitances):.6e} F = {min(capacitances)*1000:.6f} mF")
-            print(f"最大值: {max(capacitances):.6e} F = {max(capacitances)*1000:.6f} mF")
-            std_dev = statistics.stdev(capacitances) if len(capacitances) > 1 else 0
-            print(f"标准偏差: {std_dev:.6e} F = {std_dev*1000:.6f} mF")
-            print(f"变异系数: {(std_dev/avg_capacitance)*100:.2f}%")
-        else:
-            print(f"电容值: {capacitances[0]:.6e} F = {capacitances[0]*1000:.6f} mF")
-        print("="*70)
-        
-        return True
+        # 输出先缓存在列表中，最后一次性写出
+        out = []
+        p = out.append
+        try:
+            p("="*70)
+            p("CV数据分析结果")
+            p("="*70)
+            p("")
+            
+            # 打印元数据
+            self._print_metadata(p)
+            p("")
+            
+            # 分割数据为多个循环
+            cycles = self._split_into_cycles()
+            
+            if not cycles:
+                p("错误：无法分割循环数据")
+                return False
+            
+            p(f"识别到 {len(cycles)} 轮循环")
+            p("")
+            
+            # 计算每个循环的电容
+            capacitances = []
+            cycle_results = []
+            
+            for result in self._calculate_all_capacitances(cycles):
+                if result is not None:
+                    capacitances.append(result['capacitance'])
+                    cycle_results.append(result)
+            
+            # 打印每个循环的结果
+            p("各循环的计算结果：")
+            p("-"*70)
+            for result in cycle_results:
+                p(f"循环 {result['cycle_num']}:")
+                p(f"  面积 (Area): {result['area']:.6e} C")
+                p(f"  电容 (Capacitance): {result['capacitance']:.6e} F = {result['capacitance']*1000:.6f} mF")
+                if result['warning']:
+                    p(f"  警告: {result['warning']}")
+                p("")
+            
+            if not capacitances:
+                p("错误：所有循环都因超出灵敏度范围被忽略")
+                return False
+            
+            # 计算平均值（排除最离群值）
+            avg_capacitance = self._calculate_robust_average(capacitances)
+            
+            p("="*70)
+            p("最终结果：")
+            p("-"*70)
+            p(f"有效循环数: {len(capacitances)}")
+            p(f"被排除的离群值个数: {self.outlier_count}")
+            if len(capacitances) > 1:
+                p(f"平均电容值: {avg_capacitance:.6e} F = {avg_capacitance*1000:.6f} mF")
+                p(f"最小值: {min(capacitances):.6e} F = {min(capacitances)*1000:.6f} mF")
+                p(f"最大值: {max(capacitances):.6e} F = {max(capacitances)*1000:.6f} mF")
+                std_dev = statistics.stdev(capacitances) if len(capacitances) > 1 else 0
+                p(f"标准偏差: {std_dev:.6e} F = {std_dev*1000:.6f} mF")
+                p(f"变异系数: {(std_dev/avg_capacitance)*100:.2f}%")
+            else:
+                p(f"电容值: {capacitances[0]:.6e} F = {capacitances[0]*1000:.6f} mF")
+            p("="*70)
+            
+            return True
+        finally:
+            sys.stdout.write('\n'.join(out) + '\n')
     
-    def _print_metadata(self) -> None:
-        """打印元数据"""
-        print("实验参数：")
+    def _print_metadata(self, p=print) -> None:
+        """
+        打印元数据
+        
+        Args:
+            p: 逐行输出函数，默认为print
+        """
+        p("实验参数：")
         if 'init_e' in self.metadata:
-            print(f"  初始电压 (Init E): {self.metadata['init_e']} V")
+            p(f"  初始电压 (Init E): {self.metadata['init_e']} V")
         if 'high_e' in self.metadata:
-            print(f"  最高电压 (High E): {self.metadata['high_e']} V")
+            p(f"  最高电压 (High E): {self.metadata['high_e']} V")
         if 'low_e' in self.metadata:
-            print(f"  最低电压 (Low E): {self.metadata['low_e']} V")
+            p(f"  最低电压 (Low E): {self.metadata['low_e']} V")
         if 'scan_rate' in self.metadata:
-            print(f"  扫描速率 (Scan Rate): {self.metadata['scan_rate']} V/s")
+            p(f"  扫描速率 (Scan Rate): {self.metadata['scan_rate']} V/s")
         if 'segment' in self.metadata:
-            print(f"  段数 (Segment): {self.metadata['segment']} (循环数: {self.metadata['segment']//2})")
+            p(f"  段数 (Segment): {self.metadata['segment']} (循环数: {self.metadata['segment']//2})")
         if 'sample_interval' in self.metadata:
-            print(f"  采样间隔 (Sample Interval): {self.metadata['sample_interval']} V")
+            p(f"  采样间隔 (Sample Interval): {self.metadata['sample_interval']} V")
         if 'sensitivity' in self.metadata:
-            print(f"  灵敏度 (Sensitivity): {self.metadata['sensitivity']:.0e} A/V")
+            p(f"  灵敏度 (Sensitivity): {self.metadata['sensitivity']:.0e} A/V")
     
-    def _split_into_cycles(self) -> List[List[Tuple[float, float]]]:
+    def _split_into_cycles(self) -> List[np.ndarray]:
         """
         将数据分割为多个循环
         基于电压方向的变化来识别循环边界
         
         Returns:
-            每个循环的[(voltage, current)]列表
+            每个循环的(N, 2)电压-电流数组列表
         """
-        if len(self.voltage_current_data) < 2:
+        if self.voltages.size < 2:
             return []
         
-        cycles = []
-        current_cycle = []
-        
         # 根据Segment数计算预期循环数
         segment = self.metadata.get('segment', 10)
         expected_cycles = segment // 2
         
         # 识别电压方向的变化
-        # 通过检查相邻数据点之间的电压趋势
-        direction_changes = [0]  # 第一个点的方向为正（向上）
-        
-        for i in range(1, len(self.voltage_current_data)):
-            curr_v = self.voltage_current_data[i][0]
-            prev_v = self.voltage_current_data[i-1][0]
-            
-            if curr_v > prev_v:
-                direction_changes.append(1)  # 向上
-            elif curr_v < prev_v:
-                direction_changes.append(-1)  # 向下
-            else:
-                direction_changes.append(direction_changes[-1])  # 保持前一方向
+        # 通过检查相邻数据点之间的电压趋势：1向上，-1向下，电压不变时保持前一方向
+        signs = np.sign(np.diff(self.voltages)).astype(np.int8)
+        last_nonzero = np.where(signs != 0, np.arange(signs.size), 0)
+        np.maximum.accumulate(last_nonzero, out=last_nonzero)
+        # 第一个点的方向记为0
+        direction = np.concatenate((np.zeros(1, dtype=np.int8), signs[last_nonzero]))
         
         # 找到方向变化的点
-        direction_change_indices = [0]
-        for i in range(1, len(direction_changes)):
-            if direction_changes[i] != direction_changes[i-1] and direction_changes[i] != 0 and direction_changes[i-1] != 0:
-                direction_change_indices.append(i)
+        prev_dir, curr_dir = direction[:-1], direction[1:]
+        changed = (curr_dir != prev_dir) & (curr_dir != 0) & (prev_dir != 0)
+        direction_change_indices = np.flatnonzero(changed) + 1
         
         # 根据方向变化分割循环
-        cycle_boundaries = [0]
-        for idx in direction_change_indices[1:]:
-            if len(cycle_boundaries) < segment:
-                cycle_boundaries.append(idx)
-        cycle_boundaries.append(len(self.voltage_current_data))
-        
-        # 从边界创建循环
-        for i in range(len(cycle_boundaries) - 1):
-            start_idx = cycle_boundaries[i]
-            end_idx = cycle_boundaries[i + 1]
-            
-            cycle_data = self.voltage_current_data[start_idx:end_idx]
-            if len(cycle_data) >= 2:
-                cycles.append(cycle_data)
+        n_points = self.voltages.size
+        cycle_boundaries = [0] + direction_change_indices[:max(segment - 1, 0)].tolist() + [n_points]
+        
+        # 从边界创建循环（数组视图，不复制数据）
+        bounds = []
+        for start_idx, end_idx in zip(cycle_boundaries[:-1], cycle_boundaries[1:]):
+            if end_idx - start_idx >= 2:
+                bounds.append((start_idx, end_idx))
+        cycles = [self._samples[start_idx:end_idx] for start_idx, end_idx in bounds]
         
         # 如果循环数与期望不符，尝试配对方向扫
         if len(cycles) > expected_cycles:
             # 将相邻的两个方向扫作为一个完整循环
             paired_cycles = []
             for i in range(0, len(cycles) - 1, 2):
-                forward = cycles[i]
-                reverse = cycles[i + 1]
-                # 合并正扫和反扫
-                combined = forward + reverse
+                (f_start, f_end), (r_start, r_end) = bounds[i], bounds[i + 1]
+                # 合并正扫和反扫，相邻时直接取连续视图
+                if f_end == r_start:
+                    combined = self._samples[f_start:r_end]
+                else:
+                    combined = np.concatenate((cycles[i], cycles[i + 1]))
                 if len(combined) > 1:
                     paired_cycles.append(combined)
             
@@ -304,13 +414,13 @@ class CVAnalyzer:
         
         return cycles
     
-    def _calculate_cycle_capacitance(self, cycle_num: int, cycle_data: List[Tuple[float, float]]) -> Optional[Dict]:
+    def _calculate_cycle_capacitance(self, cycle_num: int, cycle_data: np.ndarray) -> Optional[Dict]:
         """
         计算单个循环的电容
         
         Args:
             cycle_num: 循环编号
-            cycle_data: [(voltage, current)]列表
+            cycle_data: (N, 2)电压-电流数组
             
         Returns:
             包含计算结果的字典，或None if error
@@ -320,40 +430,57 @@ class CVAnalyzer:
         
         sensitivity = self.metadata.get('sensitivity', 1e-5)
         threshold = sensitivity * self.sensitivity_threshold_factor
+        scan_rate = self.metadata.get('scan_rate', 0.01)
+        
+        # 检查电流是否超出范围（单次归约，不生成中间列表）
+        if np.abs(cycle_data[:, 1]).max() > threshold:
+            return self._overflow_result(cycle_num)
+        
+        # 电容 = 面积 / (扫速 * 电压范围)，扫速为0时无需再做积分
+        if scan_rate == 0:
+            return None
         
-        # 检查电流是否超出范围
-        currents = [abs(i) for _, i in cycle_data]
-        has_overflow = any(c > threshold for c in currents)
-        
-        if has_overflow:
-            return {
-                'cycle_num': cycle_num,
-                'area': 0,
-                'capacitance': 0,
-                'is_outlier': True,
-                'outlier_reason': '电流溢出',
-                'warning': f'电流值超出{self.sensitivity_threshold_factor}x灵敏度范围，本循环数据被忽略'
-            }
-        
-        # 将循环分为正扫和反扫
+        # 将循环分为正扫和反扫（均为cycle_data的视图）
         forward_scan, reverse_scan = self._split_forward_reverse(cycle_data)
         
-        if not forward_scan or not reverse_scan:
+        if len(forward_scan) == 0 or len(reverse_scan) == 0:
             return None
         
         # 计算面积（积分）
         area = self._calculate_area(forward_scan, reverse_scan)
         
-        # 计算电容
-        # 电容 = 面积 / (扫速 * 电压范围)
-        scan_rate = self.metadata.get('scan_rate', 0.01)
-        if scan_rate == 0:
-            return None
+        # 电压范围：正扫终点即为最大电压点
+        forward_v = forward_scan[:, 0]
+        voltage_range = float(forward_v[-1] - forward_v.min())
         
-        # 电压范围
-        voltages = [v for v, _ in forward_scan]
-        voltage_range = max(voltages) - min(voltages) if voltages else 1
+        return self._capacitance_result(cycle_num, area, voltage_range, scan_rate)
+    
+    def _calculate_all_capacitances(self, cycles: List[np.ndarray]) -> List[Optional[Dict]]:
+        """
+        计算所有循环的电容
         
+        Args:
+            cycles: 每个循环的(N, 2)电压-电流数组列表
+            
+        Returns:
+            与cycles一一对应的结果字典列表，无法计算的循环为None
+        """
+        return [self._calculate_cycle_capacitance(cycle_num, cycle_data)
+                for cycle_num, cycle_data in enumerate(cycles, 1)]
+    
+    def _overflow_result(self, cycle_num: int) -> Dict:
+        """电流溢出循环的结果字典"""
+        return {
+            'cycle_num': cycle_num,
+            'area': 0,
+            'capacitance': 0,
+            'is_outlier': True,
+            'outlier_reason': '电流溢出',
+            'warning': f'电流值超出{self.sensitivity_threshold_factor}x灵敏度范围，本循环数据被忽略'
+        }
+    
+    def _capacitance_result(self, cycle_num: int, area: float, voltage_range: float, scan_rate: float) -> Dict:
+        """由面积和电压范围计算电容，返回结果字典"""
         capacitance = area / (2*scan_rate * voltage_range)
         
         return {
@@ -365,24 +492,18 @@ class CVAnalyzer:
             'warning': None
         }
     
-    def _split_forward_reverse(self, cycle_data: List[Tuple[float, float]]) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+    def _split_forward_reverse(self, cycle_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         将循环数据分为正扫和反扫
         
         Returns:
-            (正扫数据, 反扫数据)
+            (正扫数据, 反扫数据)，均为cycle_data的视图
         """
         if len(cycle_data) < 2:
-            return [], []
+            return cycle_data[:0], cycle_data[:0]
         
-        # 找到最大电压点
-        max_idx = 0
-        max_voltage = cycle_data[0][0]
-        
-        for i, (v, _) in enumerate(cycle_data):
-            if v > max_voltage:
-                max_voltage = v
-                max_idx = i
+        # 找到最大电压点（多个最大值时取第一个）
+        max_idx = int(cycle_data[:, 0].argmax())
         
         # 正扫：从开始到最大点
         forward = cycle_data[:max_idx+1]
@@ -391,11 +512,10 @@ class CVAnalyzer:
         
         return forward, reverse
     
-    def _calculate_area(self, forward_scan: List[Tuple[float, float]], 
-                        reverse_scan: List[Tuple[float, float]]) -> float:
+    def _calculate_area(self, forward_scan: np.ndarray, reverse_scan: np.ndarray) -> float:
         """
         计算正扫和反扫之间的面积
-        使用梯形积分方法
+        将反扫电流线性插值到正扫电压点后，使用梯形积分方法
         
         Args:
             forward_scan: 正扫数据
@@ -404,31 +524,18 @@ class CVAnalyzer:
         Returns:
             面积值
         """
-        area = 0
+        fv, fi = forward_scan[:, 0], forward_scan[:, 1]
+        rv, ri = reverse_scan[:, 0], reverse_scan[:, 1]
         
-        # 建立反扫数据的voltage->current映射
-        reverse_dict = {round(v, 6): i for v, i in reverse_scan}
+        # 将反扫电流按电压插值到正扫的各电压点上
+        order = np.argsort(rv, kind='mergesort')
+        ri_at_fv = np.interp(fv, rv[order], ri[order])
         
-        # 对正扫中的每个点，计算与反扫的差异
-        for i in range(len(forward_scan) - 1):
-            v1, i1 = forward_scan[i]
-            v2, i2 = forward_scan[i+1]
-            
-            # 查找反扫中对应的电流，使用舍入来处理浮点数精度
-            v1_rounded = round(v1, 6)
-            v2_rounded = round(v2, 6)
-            
-            if v1_rounded in reverse_dict and v2_rounded in reverse_dict:
-                ir1 = reverse_dict[v1_rounded]
-                ir2 = reverse_dict[v2_rounded]
-                
-                # 计算梯形面积：(i_forward - i_reverse) * dV
-                # 使用中点值的平均
-                dV = abs(v2 - v1)
-                delta_i_avg = ((i1 - ir1) + (i2 - ir2)) / 2
-                area += delta_i_avg * dV
+        # 计算梯形面积：(i_forward - i_reverse) * dV
+        delta_i = fi - ri_at_fv
+        area = 0.5 * np.sum((delta_i[1:] + delta_i[:-1]) * np.abs(np.diff(fv)))
         
-        return abs(area)
+        return abs(float(area))
     
     def _calculate_robust_average(self, values: List[float]) -> float:
         """
@@ -440,35 +547,58 @@ class CVAnalyzer:
         Returns:
             平均值
         """
-        if len(values) <= self.outlier_count:
-            return statistics.mean(values)
+        arr = np.asarray(values, dtype=np.float64)
+        k = self.outlier_count
+        mean = float(arr.mean())
         
-        # 按离群程度排序（使用z-score）
-        mean = statistics.mean(values)
-        stdev = statistics.stdev(values) if len(values) > 1 else 0
+        if arr.size <= k or k <= 0:
+            return mean
+        
+        # 按离群程度（与均值的偏差）选出需要排除的值
+        stdev = float(arr.std(ddof=1)) if arr.size > 1 else 0
         
         if stdev == 0:
             return mean
         
-        # 计算z-score
-        z_scores = [(abs(v - mean) / stdev, v) for v in values]
-        z_scores.sort(reverse=True, key=lambda x: x[0])
+        # 排除最离群的k个值（partition为O(N)选择，无需完整排序）
+        deviation = np.abs(arr - mean)
+        kth = np.partition(deviation, -k)[-k]
+        drop = deviation > kth
+        # 偏差相同时优先排除靠前的值
+        drop[np.flatnonzero(deviation == kth)[:k - int(drop.sum())]] = True
         
-        # 排除最离群的值
-        remaining = [v for _, v in z_scores[self.outlier_count:]]
+        return float(arr[~drop].mean())
+    
+    def _results_to_array(self, cycle_results: List[Dict]) -> np.ndarray:
+        """
+        将循环结果字典列表转换为结构化数组（按字段连续存储）
         
-        return statistics.mean(remaining) if remaining else mean
+        Args:
+            cycle_results: 循环结果列表
+            
+        Returns:
+            dtype为_RESULT_DTYPE的一维数组
+        """
+        return np.array(
+            [(result['cycle_num'], result['area'], result['capacitance'], result.get('is_outlier', False))
+             for result in cycle_results],
+            dtype=_RESULT_DTYPE
+        )
     
-    def _get_valid_capacitances(self, cycle_results: List[Dict]) -> List[float]:
+    def _get_valid_capacitances(self, cycle_results) -> List[float]:
         """
         获取有效的电容值（排除异常值）
         
         Args:
-            cycle_results: 循环结果列表
+            cycle_results: 循环结果列表，或_results_to_array得到的结构化数组
             
         Returns:
             有效电容值列表
         """
+        if isinstance(cycle_results, np.ndarray):
+            capacitance = cycle_results['capacitance']
+            return capacitance[~cycle_results['is_outlier'] & (capacitance > 0)].tolist()
+        
         valid_capacitances = []
         for result in cycle_results:
             if not result.get('is_outlier', False) and result['capacitance'] > 0:
@@ -3,22 +3,13 @@ CV分析工具 - 主窗口
 核心GUI应用窗口，整合所有模块
 """
 
-import sys
-import os
-import tempfile
-import shutil
-
-# 在导入matplotlib之前设置后端
-os.environ['QT_API'] = 'pyside6'
-os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = ''
-
-import matplotlib
-matplotlib.use('Qt5Agg')
+import json
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QMessageBox, QFileDialog
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QMessageBox, QFileDialog,
+    QPushButton
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from pathlib import Path
 
 from cv_analysis import CVAnalyzer
@@ -35,7 +26,32 @@ from ui_components import (
     create_save_buttons_layout
 )
 from data_display import update_cycles_table, update_result_text
-from plot_manager import plot_data, save_plot_png, save_plot_svg, copy_plot_to_clipboard
+from plot_manager import (
+    plot_data, apply_plot_config, save_plot_png, save_plot_svg, copy_plot_to_clipboard
+)
+
+
+_mpl_ready = False
+
+
+def _ensure_mpl():
+    """
+    首次创建画布前导入matplotlib并设置Qt后端（matplotlib导入较慢，不在模块导入时进行）
+    全局字体和路径简化参数也在此处设置一次，绘图时不再逐次修改rcParams
+    """
+    global _mpl_ready
+    if not _mpl_ready:
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        matplotlib.rcParams.update({
+            'font.family': 'Times New Roman',
+            'font.size': 12,
+            # 合并近似共线的线段，并分块绘制长路径，加快数据点很多时的绘制
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+        })
+        _mpl_ready = True
 
 
 class CVAnalysisGUI(QMainWindow):
@@ -47,15 +63,37 @@ class CVAnalysisGUI(QMainWindow):
         self.cycles_data = []
         self.capacitances = []
         self.cycle_results = []
+        # cycle_array的缓存：(生成它的cycle_results列表, 结构化数组)
+        self._cycle_array_cache = (None, None)
         self.file_path = None
         self.electrode_area = None
-        self.temp_dir = tempfile.mkdtemp(prefix="cv_analysis_")
+        # 上次绘图的输入标识，输入不变时跳过重绘
+        self._last_plot_key = None
+        # 上次绘图的图元，只有绘图配置改变时用于直接更新样式
+        self._plot_artists = None
+        # 复制到剪切板的图像缓存，画布每次重绘后失效
+        self._clipboard_pixmap = None
+        
+        # 电极面积连续变化时（滚轮、方向键）合并刷新，停止输入200ms后才更新显示
+        self._area_timer = QTimer(self)
+        self._area_timer.setSingleShot(True)
+        self._area_timer.setInterval(200)
+        self._area_timer.timeout.connect(self._refresh_after_area_change)
         
         # 初始化配置管理器
         self.config_manager = ConfigManager()
         
         self.init_ui()
     
+    @property
+    def cycle_array(self):
+        """cycle_results的结构化数组形式（由cycle_results生成，结果列表被替换后重新生成）"""
+        source, array = self._cycle_array_cache
+        if source is not self.cycle_results:
+            array = self.analyzer._results_to_array(self.cycle_results)
+            self._cycle_array_cache = (self.cycle_results, array)
+        return array
+    
     def init_ui(self):
         """初始化用户界面"""
         self.setWindowTitle("循环伏安分析工具 (CV Analysis Tool)")
@@ -79,7 +117,9 @@ class CVAnalysisGUI(QMainWindow):
         # 创建UI元素
         self.cycles_table = create_cycles_table()
         self.result_text = create_result_text_widget()
+        _ensure_mpl()
         self.figure, self.canvas, canvas_widget = create_matplotlib_canvas()
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         
         # 左侧面板
         left_layout = create_left_panel_layout(self.cycles_table, self.result_text)
@@ -96,7 +136,6 @@ class CVAnalysisGUI(QMainWindow):
         right_layout.addLayout(save_layout)
         
         # 配置按钮
-        from PySide6.QtWidgets import QPushButton
         config_btn = QPushButton("绘图配置")
         config_btn.clicked.connect(self.open_plot_config)
         right_layout.addWidget(config_btn)
@@ -135,15 +174,6 @@ class CVAnalysisGUI(QMainWindow):
         reset_config_action = config_menu.addAction("重置为默认配置")
         reset_config_action.triggered.connect(self.reset_config)
     
-    def closeEvent(self, event):
-        """关闭应用时清理临时目录"""
-        try:
-            if hasattr(self, 'temp_dir') and Path(self.temp_dir).exists():
-                shutil.rmtree(self.temp_dir)
-        except:
-            pass
-        super().closeEvent(event)
-    
     def on_area_changed(self, value):
         """电极面积改变时的处理"""
         if value > 0:
@@ -151,22 +181,24 @@ class CVAnalysisGUI(QMainWindow):
         else:
             self.electrode_area = None
         
+        # 重新计时，连续的修改只触发一次刷新
+        self._area_timer.start()
+    
+    def _refresh_after_area_change(self):
+        """电极面积修改停止后刷新表格、结果文本和图表"""
         # 如果已经有数据，重新更新结果显示
         if self.capacitances:
-            update_cycles_table(self.cycles_table, self.cycle_results, self.analyzer, self.electrode_area)
+            update_cycles_table(self.cycles_table, self.cycle_results, self.analyzer, self.electrode_area,
+                                valid_capacitances=self.capacitances)
             update_result_text(self.result_text, self.cycle_results, self.analyzer, 
-                             self.analyzer.metadata, self.electrode_area)
+                             self.analyzer.metadata, self.electrode_area,
+                             valid_capacitances=self.capacitances)
             # 绘制图表时传入配置
-            plot_config = self.config_manager.get_plot_config()
-            plot_data(self.figure, self.canvas, self.cycles_data, self.cycle_results, 
-                     self.analyzer, self.electrode_area, config=plot_config)
+            self._redraw_plot(self.config_manager.get_plot_config())
     
     def load_file(self):
         """打开文件对话框选择CV数据文件"""
-        from PySide6.QtWidgets import QFileDialog
-        
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(
+        file_path, _ = QFileDialog.getOpenFileName(
             self,
             "选择CV数据文件",
             "",
@@ -208,15 +240,11 @@ class CVAnalysisGUI(QMainWindow):
             self.statusBar().showMessage("正在计算电容值...")
             
             # 计算每个循环的电容
-            self.capacitances = []
-            self.cycle_results = []
+            results = self.analyzer._calculate_all_capacitances(self.cycles_data)
+            self.cycle_results = [result for result in results if result is not None]
             
-            for cycle_num, cycle_data in enumerate(self.cycles_data, 1):
-                result = self.analyzer._calculate_cycle_capacitance(cycle_num, cycle_data)
-                if result is not None:
-                    self.cycle_results.append(result)
-                    if not result.get('is_outlier', False) and result['capacitance'] > 0:
-                        self.capacitances.append(result['capacitance'])
+            # 有效电容值由结构化数组的掩码一次筛选（self.capacitances供各显示函数复用）
+            self.capacitances = self.analyzer._get_valid_capacitances(self.cycle_array)
             
             if not self.cycle_results:
                 QMessageBox.critical(self, "错误", "无法处理任何循环")
@@ -226,16 +254,16 @@ class CVAnalysisGUI(QMainWindow):
             self.statusBar().showMessage("正在更新显示...")
             
             # 更新表格
-            update_cycles_table(self.cycles_table, self.cycle_results, self.analyzer, self.electrode_area)
+            update_cycles_table(self.cycles_table, self.cycle_results, self.analyzer, self.electrode_area,
+                                valid_capacitances=self.capacitances)
             
             # 更新结果文本
             update_result_text(self.result_text, self.cycle_results, self.analyzer, 
-                             self.analyzer.metadata, self.electrode_area)
+                             self.analyzer.metadata, self.electrode_area,
+                             valid_capacitances=self.capacitances)
             
-            # 绘制图表（传入配置）
-            plot_config = self.config_manager.get_plot_config()
-            plot_data(self.figure, self.canvas, self.cycles_data, self.cycle_results, 
-                     self.analyzer, self.electrode_area, config=plot_config)
+            # 绘制图表（传入配置，新数据总是重绘）
+            self._redraw_plot(self.config_manager.get_plot_config(), force=True)
             
             # 启用保存按钮
             self.save_png_btn.setEnabled(True)
@@ -258,7 +286,36 @@ class CVAnalysisGUI(QMainWindow):
     
     def copy_plot_to_clipboard(self):
         """将图表复制到剪切板"""
-        copy_plot_to_clipboard(self.figure, self.temp_dir, self, self.statusBar())
+        self._clipboard_pixmap = copy_plot_to_clipboard(self.figure, self, self.statusBar(),
+                                                        pixmap=self._clipboard_pixmap)
+    
+    def _redraw_plot(self, plot_config, force=False):
+        """
+        重新绘制图表，数据、电极面积和绘图配置均未改变时跳过
+        只有绘图配置改变时仅更新字体样式，不重新绘制曲线；
+        其他情况下复用已有的坐标轴和曲线对象，由plot_data更新数据
+        
+        Args:
+            plot_config: 绘图配置字典
+            force: 为True时总是重绘（加载新数据后使用）
+        """
+        key = (id(self.cycles_data), self.electrode_area, json.dumps(plot_config, sort_keys=True))
+        last_key = self._last_plot_key
+        if not force and key == last_key:
+            return
+        
+        self._clipboard_pixmap = None
+        if not force and self._plot_artists is not None and last_key is not None and key[:2] == last_key[:2]:
+            apply_plot_config(self.figure, self.canvas, self._plot_artists, plot_config)
+        else:
+            self._plot_artists = plot_data(self.figure, self.canvas, self.cycles_data, self.cycle_array,
+                                           self.analyzer, self.electrode_area, config=plot_config,
+                                           artists=self._plot_artists)
+        self._last_plot_key = key
+    
+    def _on_canvas_draw(self, event):
+        """画布重绘（包括工具栏缩放、平移）后，缓存的剪切板图像失效"""
+        self._clipboard_pixmap = None
     
     def open_plot_config(self):
         """打开绘图配置对话框"""
@@ -273,14 +330,12 @@ class CVAnalysisGUI(QMainWindow):
             # 如果有已加载的数据，重新绘制
             if self.cycles_data and self.cycle_results:
                 self.statusBar().showMessage("应用新的绘图配置...")
-                plot_data(self.figure, self.canvas, self.cycles_data, self.cycle_results,
-                         self.analyzer, self.electrode_area, config=new_config)
+                self._redraw_plot(new_config)
                 self.statusBar().showMessage("绘图配置已更新")
     
     def import_config(self):
         """导入配置文件"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(
+        file_path, _ = QFileDialog.getOpenFileName(
             self,
             "导入配置文件",
             "",
@@ -294,17 +349,14 @@ class CVAnalysisGUI(QMainWindow):
                 
                 # 重新绘制图表
                 if self.cycles_data and self.cycle_results:
-                    plot_config = self.config_manager.get_plot_config()
-                    plot_data(self.figure, self.canvas, self.cycles_data, self.cycle_results,
-                             self.analyzer, self.electrode_area, config=plot_config)
+                    self._redraw_plot(self.config_manager.get_plot_config())
             else:
                 QMessageBox.critical(self, "错误", "导入配置失败，请检查文件格式")
                 self.statusBar().showMessage("配置导入失败")
     
     def export_config(self):
         """导出配置文件"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(
+        file_path, _ = QFileDialog.getSaveFileName(
             self,
             "导出配置文件",
             "cv_plot_config.json",
@@ -335,17 +387,13 @@ class CVAnalysisGUI(QMainWindow):
             
             # 重新绘制图表
             if self.cycles_data and self.cycle_results:
-                plot_config = self.config_manager.get_plot_config()
-                plot_data(self.figure, self.canvas, self.cycles_data, self.cycle_results,
-                         self.analyzer, self.electrode_area, config=plot_config)
+                self._redraw_plot(self.config_manager.get_plot_config())
 
 
 def main():
-    """主函数"""
-    app = QApplication(sys.argv)
-    window = CVAnalysisGUI()
-    window.show()
-    sys.exit(app.exec())
+    """主函数（Qt环境设置统一在start_gui中完成）"""
+    from start_gui import run_gui
+    run_gui(CVAnalysisGUI)
 
 
 if __name__ == "__main__":
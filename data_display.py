@@ -5,55 +5,81 @@
 
 from PySide6.QtWidgets import QTableWidgetItem
 from PySide6.QtGui import QFont
-import statistics
+import numpy as np
 
 
-def get_capacitance_unit(cycle_results, capacitances, analyzer, electrode_area, use_specific=False):
+# 表格单元格字体（需在QApplication创建后才能构造，首次使用时创建）
+_CELL_FONT = None
+
+
+def _cell_font():
+    """获取表格单元格字体"""
+    global _CELL_FONT
+    if _CELL_FONT is None:
+        _CELL_FONT = QFont("Arial", 11)
+    return _CELL_FONT
+
+
+# 电容单位阈值表（单位F，从大到小）：最小电容超过阈值时使用对应单位
+_CAP_UNITS = (
+    (1e-3, ('mF', 1000, 'mF')),  # > 1000µF
+    (1e-6, ('µF', 1e6, 'µF')),   # > 1000nF
+)
+_DEFAULT_CAP_UNIT = ('nF', 1e9, 'nF')
+
+
+def _unit_for_cap(min_cap):
+    """根据最小电容值（F）选择单位"""
+    for threshold, unit in _CAP_UNITS:
+        if min_cap > threshold:
+            return unit
+    return _DEFAULT_CAP_UNIT
+
+
+def _unit_for_specific_cap(min_cap, electrode_area):
+    """根据最小单位面积电容值（F/cm²）选择单位"""
+    return _unit_for_cap(min_cap / electrode_area)
+
+
+def get_capacitance_unit(cycle_results, capacitances, analyzer, electrode_area, use_specific=False,
+                         valid_capacitances=None):
     """
     根据有效电容值（排除异常值）自动选择单位
     如果use_specific=True，根据单位面积容值选择单位
     否则根据原始电容值选择单位
+    valid_capacitances为已计算的有效电容值，为None时从cycle_results中获取
     返回值: (单位字符, 转换因子(从F), 单位显示名称)
     """
     if not capacitances:
-        return ('nF', 1e9, 'nF')
+        return _DEFAULT_CAP_UNIT
     
     # 获取有效的电容值（排除异常值）
-    valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
+    if valid_capacitances is None:
+        valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
     
     if not valid_capacitances:
         # 如果没有有效值，回退到所有值
         valid_capacitances = capacitances
     
+    min_cap = float(np.asarray(valid_capacitances, dtype=np.float64).min())
+    
     if use_specific and electrode_area and electrode_area > 0:
         # 基于单位面积容值选择单位
-        specific_capacitances = [cap / electrode_area for cap in valid_capacitances]
-        min_specific_nF = min(specific_capacitances) * 1e9  # 转换为nF
-        
-        if min_specific_nF > 1000 * 1000:  # > 1000µF
-            return ('mF', 1000, 'mF')
-        elif min_specific_nF > 1000:  # > 1000nF
-            return ('µF', 1e6, 'µF')
-        else:
-            return ('nF', 1e9, 'nF')
-    else:
-        # 基于原始电容值选择单位
-        min_cap_nF = min(valid_capacitances) * 1e9  # 转换为nF
-        
-        if min_cap_nF > 1000 * 1000:  # > 1000µF
-            return ('mF', 1000, 'mF')
-        elif min_cap_nF > 1000:  # > 1000nF
-            return ('µF', 1e6, 'µF')
-        else:
-            return ('nF', 1e9, 'nF')
+        return _unit_for_specific_cap(min_cap, electrode_area)
+    # 基于原始电容值选择单位
+    return _unit_for_cap(min_cap)
 
 
-def update_cycles_table(cycles_table, cycle_results, analyzer, electrode_area):
+def update_cycles_table(cycles_table, cycle_results, analyzer, electrode_area, valid_capacitances=None):
     """更新循环结果表格"""
-    cycles_table.setRowCount(len(cycle_results))
+    # 行数不变时（如修改电极面积后刷新）复用已有的单元格，只更新文本
+    reuse = cycles_table.rowCount() == len(cycle_results)
+    if not reuse:
+        cycles_table.setRowCount(len(cycle_results))
     
     # 获取有效的电容值
-    valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
+    if valid_capacitances is None:
+        valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
     capacitances = [r['capacitance'] for r in cycle_results if r['capacitance'] > 0]
     
     # 获取电容单位
@@ -62,143 +88,151 @@ def update_cycles_table(cycles_table, cycle_results, analyzer, electrode_area):
         capacitances,
         analyzer,
         electrode_area,
-        use_specific=(electrode_area is not None and electrode_area > 0)
+        use_specific=(electrode_area is not None and electrode_area > 0),
+        valid_capacitances=valid_capacitances
     )
     
     # 更新表格列标题
-    if electrode_area and electrode_area > 0:
+    has_area = bool(electrode_area and electrode_area > 0)
+    if has_area:
         cycles_table.setColumnCount(4)
         cycles_table.setHorizontalHeaderLabels(["循环", "面积 (C)", f"单位面积容 ({cap_display}/cm²)", "备注"])
     else:
         cycles_table.setColumnCount(4)
         cycles_table.setHorizontalHeaderLabels(["循环", "面积 (C)", f"电容 ({cap_display})", "备注"])
     
-    for row, result in enumerate(cycle_results):
-        cycle_num = result['cycle_num']
-        area = result['area']
-        capacitance = result['capacitance']
-        
-        # 循环号
-        item = QTableWidgetItem(str(cycle_num))
-        item.setFont(QFont("Arial", 11))
-        cycles_table.setItem(row, 0, item)
-        
-        # 面积（4位有效数字科学计数法）
-        area_str = f"{area:.4e}" if area != 0 else "0.0000e+00"
-        item = QTableWidgetItem(area_str)
-        item.setFont(QFont("Arial", 11))
-        cycles_table.setItem(row, 1, item)
-        
-        # 电容或单位面积电容
-        if electrode_area and electrode_area > 0:
-            # 显示单位面积电容
-            if capacitance > 0:
-                specific_cap = (capacitance / electrode_area) * cap_factor
-                cap_str = f"{specific_cap:.6g}"
-            else:
-                cap_str = "—"
-        else:
-            # 显示普通电容（根据单位转换）
-            if capacitance > 0:
-                cap_value = capacitance * cap_factor
-                cap_str = f"{cap_value:.6g}"
-            else:
-                cap_str = "—"
-        
-        item = QTableWidgetItem(cap_str)
-        item.setFont(QFont("Arial", 11))
-        cycles_table.setItem(row, 2, item)
-        
-        # 备注列 - 显示异常原因
-        remark_str = ""
-        if result.get('is_outlier', False):
-            remark_str = result.get('outlier_reason', '数据异常')
-        
-        item = QTableWidgetItem(remark_str)
-        item.setFont(QFont("Arial", 11))
-        cycles_table.setItem(row, 3, item)
+    # 单位面积电容与普通电容只差一个除数，在循环外确定
+    divisor = electrode_area if has_area else 1.0
     
-    cycles_table.resizeColumnsToContents()
+    # 批量填充表格：期间关闭重绘、排序和信号，结束后统一刷新
+    font = _cell_font()
+    QTWI = QTableWidgetItem
+    set_item = cycles_table.setItem
+    get_item = cycles_table.item
+    sorting_enabled = cycles_table.isSortingEnabled()
+    cycles_table.setUpdatesEnabled(False)
+    cycles_table.setSortingEnabled(False)
+    cycles_table.blockSignals(True)
+    try:
+        for row, result in enumerate(cycle_results):
+            area = result['area']
+            capacitance = result['capacitance']
+            
+            # 面积（4位有效数字科学计数法）
+            area_str = f"{area:.4e}" if area != 0 else "0.0000e+00"
+            # 电容或单位面积电容（根据单位转换）
+            cap_str = f"{(capacitance / divisor) * cap_factor:.6g}" if capacitance > 0 else "—"
+            # 备注列 - 显示异常原因
+            remark_str = result.get('outlier_reason', '数据异常') if result.get('is_outlier', False) else ""
+            
+            for col, text in enumerate((str(result['cycle_num']), area_str, cap_str, remark_str)):
+                item = get_item(row, col) if reuse else None
+                if item is None:
+                    item = QTWI(text)
+                    item.setFont(font)
+                    set_item(row, col, item)
+                else:
+                    item.setText(text)
+    finally:
+        cycles_table.blockSignals(False)
+        cycles_table.setSortingEnabled(sorting_enabled)
+        cycles_table.setUpdatesEnabled(True)
+
+
+# 结果文本中显示的实验参数：(元数据键, 名称, 格式)
+_META_FIELDS = (
+    ('init_e', '初始电压', '{} V'),
+    ('high_e', '最高电压', '{} V'),
+    ('low_e', '最低电压', '{} V'),
+    ('scan_rate', '扫描速率', '{} V/s'),
+    ('sensitivity', '灵敏度', '{:.0e} A/V'),
+)
+
+# 实验参数行的缓存：参数值 -> 文本，只保留最近一次
+# 电极面积行不放入缓存，修改电极面积时参数行仍可复用
+_header_cache = {}
 
 
-def update_result_text(result_text, cycle_results, analyzer, metadata, electrode_area):
+def _format_result_header(metadata):
+    """生成结果文本的实验参数行，参数不变时直接使用缓存"""
+    values = tuple(metadata.get(key) for key, _, _ in _META_FIELDS)
+    header = _header_cache.get(values)
+    if header is not None:
+        return header
+    
+    parts = ["实验参数:\n"]
+    p = parts.append
+    for (_, label, fmt), value in zip(_META_FIELDS, values):
+        if value is not None:
+            p(f"  {label}: {fmt.format(value)}\n")
+    
+    header = "".join(parts)
+    _header_cache.clear()
+    _header_cache[values] = header
+    return header
+
+
+def update_result_text(result_text, cycle_results, analyzer, metadata, electrode_area, valid_capacitances=None):
     """更新最终结果文本"""
-    text = ""
-    
-    # 实验参数
-    text += "实验参数:\n"
-    if 'init_e' in metadata:
-        text += f"  初始电压: {metadata['init_e']} V\n"
-    if 'high_e' in metadata:
-        text += f"  最高电压: {metadata['high_e']} V\n"
-    if 'low_e' in metadata:
-        text += f"  最低电压: {metadata['low_e']} V\n"
-    if 'scan_rate' in metadata:
-        text += f"  扫描速率: {metadata['scan_rate']} V/s\n"
-    if 'sensitivity' in metadata:
-        text += f"  灵敏度: {metadata['sensitivity']:.0e} A/V\n"
-    if electrode_area and electrode_area > 0:
-        text += f"  电极面积: {electrode_area:.4f} cm²\n"
-    
-    text += "\n" + "="*40 + "\n"
-    text += "最终统计结果:\n"
-    text += "-"*40 + "\n"
+    has_area = bool(electrode_area and electrode_area > 0)
+    # 实验参数行很少变化，使用缓存
+    parts = [_format_result_header(metadata)]
+    p = parts.append
+    if has_area:
+        p(f"  电极面积: {electrode_area:.4f} cm²\n")
+    
+    p("\n" + "="*40 + "\n")
+    p("最终统计结果:\n")
+    p("-"*40 + "\n")
     
     # 获取有效的电容值（排除异常值）
-    valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
+    if valid_capacitances is None:
+        valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
     total_cycles = len(cycle_results)
     valid_cycles = len(valid_capacitances)
     excluded_cycles = total_cycles - valid_cycles
     
-    text += f"总循环数: {total_cycles}\n"
-    text += f"有效循环数: {valid_cycles}\n"
+    p(f"总循环数: {total_cycles}\n")
+    p(f"有效循环数: {valid_cycles}\n")
     if excluded_cycles > 0:
-        text += f"被排除的循环数: {excluded_cycles}\n"
-    text += f"被排除离群值数: {analyzer.outlier_count}\n"
+        p(f"被排除的循环数: {excluded_cycles}\n")
+    p(f"被排除离群值数: {analyzer.outlier_count}\n")
     
-    if len(valid_capacitances) > 1:
+    if valid_cycles > 1:
         avg_capacitance = analyzer._calculate_robust_average(valid_capacitances)
+        valid_arr = np.asarray(valid_capacitances, dtype=np.float64)
+        min_cap = float(valid_arr.min())
+        max_cap = float(valid_arr.max())
+        std_dev = float(valid_arr.std(ddof=1))
+        cv_percent = (std_dev / avg_capacitance) * 100
         
-        if electrode_area and electrode_area > 0:
+        p(f"\n平均电容: {avg_capacitance:.6e} F\n")
+        p(f"           {avg_capacitance*1000:.6f} mF\n")
+        if has_area:
             # 显示单位面积电容
             specific_cap = avg_capacitance / electrode_area
-            text += f"\n平均电容: {avg_capacitance:.6e} F\n"
-            text += f"           {avg_capacitance*1000:.6f} mF\n"
-            text += f"\n单位面积电容: {specific_cap:.6e} F/cm²\n"
-            text += f"             {specific_cap*1000:.6f} mF/cm²\n"
-            text += f"             {specific_cap*1e6:.6f} µF/cm²\n"
-            
-            min_specific = min(valid_capacitances) / electrode_area
-            max_specific = max(valid_capacitances) / electrode_area
-            text += f"最小值(面积): {min_specific*1000:.6f} mF/cm²\n"
-            text += f"最大值(面积): {max_specific*1000:.6f} mF/cm²\n"
-            
-            std_dev = statistics.stdev(valid_capacitances) if len(valid_capacitances) > 1 else 0
-            std_specific = std_dev / electrode_area
-            text += f"标准差(面积): {std_specific*1000:.6f} mF/cm²\n"
-            text += f"变异系数: {(std_dev/avg_capacitance)*100:.2f}%\n"
+            p(f"\n单位面积电容: {specific_cap:.6e} F/cm²\n")
+            p(f"             {specific_cap*1000:.6f} mF/cm²\n")
+            p(f"             {specific_cap*1e6:.6f} µF/cm²\n")
+            p(f"最小值(面积): {min_cap / electrode_area * 1000:.6f} mF/cm²\n")
+            p(f"最大值(面积): {max_cap / electrode_area * 1000:.6f} mF/cm²\n")
+            p(f"标准差(面积): {std_dev / electrode_area * 1000:.6f} mF/cm²\n")
         else:
             # 显示普通电容
-            text += f"\n平均电容: {avg_capacitance:.6e} F\n"
-            text += f"           {avg_capacitance*1000:.6f} mF\n"
-            text += f"最小值: {min(valid_capacitances)*1000:.6f} mF\n"
-            text += f"最大值: {max(valid_capacitances)*1000:.6f} mF\n"
-            
-            std_dev = statistics.stdev(valid_capacitances) if len(valid_capacitances) > 1 else 0
-            text += f"标准差: {std_dev:.6e} F\n"
-            text += f"        {std_dev*1000:.6f} mF\n"
-            text += f"变异系数: {(std_dev/avg_capacitance)*100:.2f}%\n"
-    elif len(valid_capacitances) == 1:
-        if electrode_area and electrode_area > 0:
-            specific_cap = valid_capacitances[0] / electrode_area
-            text += f"\n电容值: {valid_capacitances[0]:.6e} F\n"
-            text += f"       {valid_capacitances[0]*1000:.6f} mF\n"
-            text += f"\n单位面积电容: {specific_cap:.6e} F/cm²\n"
-            text += f"             {specific_cap*1000:.6f} mF/cm²\n"
-        else:
-            text += f"\n电容值: {valid_capacitances[0]:.6e} F\n"
-            text += f"       {valid_capacitances[0]*1000:.6f} mF\n"
+            p(f"最小值: {min_cap*1000:.6f} mF\n")
+            p(f"最大值: {max_cap*1000:.6f} mF\n")
+            p(f"标准差: {std_dev:.6e} F\n")
+            p(f"        {std_dev*1000:.6f} mF\n")
+        p(f"变异系数: {cv_percent:.2f}%\n")
+    elif valid_cycles == 1:
+        cap = valid_capacitances[0]
+        p(f"\n电容值: {cap:.6e} F\n")
+        p(f"       {cap*1000:.6f} mF\n")
+        if has_area:
+            specific_cap = cap / electrode_area
+            p(f"\n单位面积电容: {specific_cap:.6e} F/cm²\n")
+            p(f"             {specific_cap*1000:.6f} mF/cm²\n")
     else:
-        text += "\n警告: 没有有效的循环数据可用于统计\n"
+        p("\n警告: 没有有效的循环数据可用于统计\n")
     
-    result_text.setText(text)
+    result_text.setText("".join(parts))
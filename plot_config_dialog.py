@@ -23,8 +23,12 @@ class PlotConfigDialog(QDialog):
             parent: 父窗口
         """
         super().__init__(parent)
-        self.config = config.copy() if config else {}
+        # 只用于初始化控件，不会被修改，无需复制
+        self._initial_config = config or {}
         self.scale_factor = 1.5
+        # 各配置项的控件，按配置键名索引
+        self._spinboxes = {}
+        self._checkboxes = {}
         self.init_ui()
         self.load_config()
         
@@ -163,22 +167,25 @@ class PlotConfigDialog(QDialog):
         bold_checkbox.setMinimumHeight(int(30 * self.scale_factor))
         layout.addWidget(bold_checkbox)
         
+        self._spinboxes[key] = size_spinbox
+        self._checkboxes[key] = bold_checkbox
+        
         group.setLayout(layout)
         return group
     
     def load_config(self):
         """加载配置到UI控件"""
-        for key, value in self.config.items():
+        for key, value in self._initial_config.items():
             if isinstance(value, dict):
                 # 字体大小
                 fontsize = value.get('fontsize', 10)
-                size_spinbox = self.findChild(QSpinBox, f"{key}_fontsize")
+                size_spinbox = self._spinboxes.get(key)
                 if size_spinbox:
                     size_spinbox.setValue(fontsize)
                 
                 # 加粗
                 bold = value.get('bold', False)
-                bold_checkbox = self.findChild(QCheckBox, f"{key}_bold")
+                bold_checkbox = self._checkboxes.get(key)
                 if bold_checkbox:
                     bold_checkbox.setChecked(bold)
     
@@ -187,8 +194,8 @@ class PlotConfigDialog(QDialog):
         config = {}
         
         for key in ['title', 'xlabel', 'ylabel', 'xtick', 'ytick', 'legend', 'text']:
-            size_spinbox = self.findChild(QSpinBox, f"{key}_fontsize")
-            bold_checkbox = self.findChild(QCheckBox, f"{key}_bold")
+            size_spinbox = self._spinboxes.get(key)
+            bold_checkbox = self._checkboxes.get(key)
             
             if size_spinbox and bold_checkbox:
                 config[key] = {
@@ -208,8 +215,8 @@ class PlotConfigDialog(QDialog):
                 fontsize = default_plot_config[key].get('fontsize', 10)
                 bold = default_plot_config[key].get('bold', False)
                 
-                size_spinbox = self.findChild(QSpinBox, f"{key}_fontsize")
-                bold_checkbox = self.findChild(QCheckBox, f"{key}_bold")
+                size_spinbox = self._spinboxes.get(key)
+                bold_checkbox = self._checkboxes.get(key)
                 
                 if size_spinbox:
                     size_spinbox.setValue(fontsize)
@@ -5,143 +5,134 @@
 支持通过config.json配置字体样式
 """
 
-import matplotlib.pyplot as plt
-import statistics
+import io
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image
+import numpy as np
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QApplication as QtApp
 from PySide6.QtWidgets import QMessageBox, QFileDialog
 from data_display import get_capacitance_unit
 
 
-def _apply_font_config(config):
-    """
-    应用字体配置到matplotlib
-    
-    Args:
-        config: 绘图配置字典
-    """
-    plt.rcParams['font.family'] = 'Times New Roman'
-
-
 def _get_font_weight(bold):
     """获取字体权重"""
     return 'bold' if bold else 'normal'
 
 
-def plot_data(figure, canvas, cycles_data, cycle_results, analyzer, electrode_area, config=None):
-    """绘制V-I曲线图"""
-    # 默认配置
-    if config is None:
-        config = {
-            'title': {'fontsize': 14, 'bold': True},
-            'xlabel': {'fontsize': 12, 'bold': False},
-            'ylabel': {'fontsize': 12, 'bold': False},
-            'xtick': {'fontsize': 10, 'bold': False},
-            'ytick': {'fontsize': 10, 'bold': False},
-            'legend': {'fontsize': 10, 'bold': False},
-            'text': {'fontsize': 9, 'bold': False}
-        }
-    
-    # 应用字体配置
-    _apply_font_config(config)
-    
-    figure.clear()
-    ax = figure.add_subplot(111)
+# PNG的zlib压缩级别：1级编码明显快于默认的6级，文件略大（图像内容相同）
+PNG_COMPRESS_LEVEL = 1
+
+# 各配置项的默认(字体大小, 是否加粗)
+_STYLE_DEFAULTS = {
+    'title': (14, True),
+    'xlabel': (12, False),
+    'ylabel': (12, False),
+    'xtick': (10, False),
+    'ytick': (10, False),
+    'legend': (10, False),
+    'text': (9, False),
+}
+
+
+def _get_styles(config):
+    """从绘图配置中取出各项的(字体大小, 字体权重)，缺失时使用默认值"""
+    styles = {}
+    for key, (default_size, default_bold) in _STYLE_DEFAULTS.items():
+        cfg = config.get(key, {'fontsize': default_size, 'bold': default_bold})
+        styles[key] = (cfg.get('fontsize', default_size), _get_font_weight(cfg.get('bold', default_bold)))
+    return styles
+
+
+def _create_legend(ax, fontsize, fontweight):
+    """创建图例并设置字体"""
+    import matplotlib.pyplot as plt
+    # 固定位置且不绘制阴影：loc='best'需要逐点检测与曲线的重叠，曲线多时绘制很慢
+    legend = ax.legend(fontsize=fontsize, 
+                      loc='upper right', framealpha=0.9, 
+                      fancybox=False, ncol=2)
+    plt.setp(legend.get_texts(), fontname='Times New Roman', fontsize=fontsize, fontweight=fontweight)
+    return legend
+
+
+def _style_artists(artists, styles):
+    """按styles设置标题、坐标轴标签、刻度和注释文字的字体"""
+    import matplotlib.pyplot as plt
+    ax = artists['ax']
+    for key in ('title', 'xlabel', 'ylabel', 'text'):
+        fontsize, fontweight = styles[key]
+        artists[key].set_fontsize(fontsize)
+        artists[key].set_fontweight(fontweight)
     
-    # 设置matplotlib字体以支持Times New Roman
-    plt.rcParams['font.family'] = 'Times New Roman'
-    plt.rcParams['font.size'] = 12
+    # 设置刻度标签字体和大小
+    xtick_size, xtick_weight = styles['xtick']
+    ytick_size, ytick_weight = styles['ytick']
+    ax.tick_params(labelsize=xtick_size)
+    plt.setp(ax.get_xticklabels(), fontname='Times New Roman', fontsize=xtick_size, fontweight=xtick_weight)
+    plt.setp(ax.get_yticklabels(), fontname='Times New Roman', fontsize=ytick_size, fontweight=ytick_weight)
+
+
+def apply_plot_config(figure, canvas, artists, config):
+    """
+    只更新已绘制图表的字体样式，不重新绘制曲线
     
-    # 定义颜色列表（支持更多循环）
-    if len(cycles_data) <= 10:
-        colors = plt.cm.tab10(range(len(cycles_data)))
-    elif len(cycles_data) <= 20:
-        colors = plt.cm.tab20(range(len(cycles_data)))
-    else:
-        colors = plt.cm.hsv([(i / len(cycles_data)) for i in range(len(cycles_data))])
+    Args:
+        artists: plot_data返回的图元字典
+        config: 绘图配置字典
+    """
+    styles = _get_styles(config)
+    _style_artists(artists, styles)
+    # 图例的边距随字体大小变化，直接按新字体重建（保留原有曲线）
+    artists['legend'] = _create_legend(artists['ax'], *styles['legend'])
+    artists['legend_style'] = styles['legend']
     
-    # 计算所有数据的最大电流值（单位：A）
-    max_current_A = 0
-    for cycle_data in cycles_data:
-        for _, current in cycle_data:
-            max_current_A = max(max_current_A, abs(current))
+    figure.tight_layout()
+    canvas.draw_idle()
+
+
+@lru_cache(maxsize=8)
+def _cycle_colors(n_cycles):
+    """
+    各循环曲线的颜色（只与循环数有关，按循环数缓存）
     
-    # 自动选择单位
-    max_current_nA = max_current_A * 1e9
+    Returns:
+        (n_cycles, 4)的只读RGBA数组
+    """
+    import matplotlib.pyplot as plt
     
-    if max_current_nA > 2000:
-        if max_current_nA > 2000 * 1000:
-            scale_factor = 1000  # A to mA
-            unit_str = 'mA'
-        else:
-            scale_factor = 1e6  # A to uA
-            unit_str = 'µA'
+    if n_cycles <= 10:
+        colors = plt.cm.tab10(np.arange(n_cycles))
+    elif n_cycles <= 20:
+        colors = plt.cm.tab20(np.arange(n_cycles))
     else:
-        scale_factor = 1e9  # A to nA
-        unit_str = 'nA'
-    
-    # 绘制每个循环的数据
-    for cycle_num, cycle_data in enumerate(cycles_data):
-        voltages = [v for v, _ in cycle_data]
-        currents = [i * scale_factor for _, i in cycle_data]
-        
-        ax.plot(voltages, currents, color=colors[cycle_num], 
-               label=f'Cycle {cycle_num+1}', linewidth=2.0, alpha=0.85, marker=None)
-    
-    # 获取配置（如果config不存在就用默认值）
-    title_cfg = config.get('title', {'fontsize': 14, 'bold': True})
-    xlabel_cfg = config.get('xlabel', {'fontsize': 12, 'bold': False})
-    ylabel_cfg = config.get('ylabel', {'fontsize': 12, 'bold': False})
-    xtick_cfg = config.get('xtick', {'fontsize': 10, 'bold': False})
-    ytick_cfg = config.get('ytick', {'fontsize': 10, 'bold': False})
-    legend_cfg = config.get('legend', {'fontsize': 10, 'bold': False})
-    text_cfg = config.get('text', {'fontsize': 9, 'bold': False})
-    
-    # 设置标签和标题
-    ax.set_xlabel('Voltage (V)', 
-                 fontsize=xlabel_cfg.get('fontsize', 12), 
-                 fontname='Times New Roman', 
-                 fontweight=_get_font_weight(xlabel_cfg.get('bold', False)))
-    ax.set_ylabel(f'Current ({unit_str})', 
-                 fontsize=ylabel_cfg.get('fontsize', 12), 
-                 fontname='Times New Roman', 
-                 fontweight=_get_font_weight(ylabel_cfg.get('bold', False)))
-    ax.set_title('CV Test - V-I Curve', 
-                fontsize=title_cfg.get('fontsize', 14), 
-                fontname='Times New Roman', 
-                fontweight=_get_font_weight(title_cfg.get('bold', True)), 
-                pad=20)
-    
-    # 设置刻度标签字体和大小
-    ax.tick_params(labelsize=xtick_cfg.get('fontsize', 10))
-    for label in ax.get_xticklabels():
-        label.set_fontname('Times New Roman')
-        label.set_fontsize(xtick_cfg.get('fontsize', 10))
-        label.set_fontweight(_get_font_weight(xtick_cfg.get('bold', False)))
-    for label in ax.get_yticklabels():
-        label.set_fontname('Times New Roman')
-        label.set_fontsize(ytick_cfg.get('fontsize', 10))
-        label.set_fontweight(_get_font_weight(ytick_cfg.get('bold', False)))
-    
-    # 设置图例
-    legend = ax.legend(fontsize=legend_cfg.get('fontsize', 10), 
-                      loc='best', framealpha=0.95, 
-                      fancybox=True, shadow=True, ncol=2)
-    for text in legend.get_texts():
-        text.set_fontname('Times New Roman')
-        text.set_fontsize(legend_cfg.get('fontsize', 10))
-        text.set_fontweight(_get_font_weight(legend_cfg.get('bold', False)))
-    
+        # 与i / n_cycles逐项相除结果完全一致
+        colors = plt.cm.hsv(np.arange(n_cycles) / n_cycles)
+    # 缓存的数组被多次绘图共用，禁止修改
+    colors.flags.writeable = False
+    return colors
+
+
+def _to_soa(cycles_data):
+    """将各循环数据转换为(N, 2)的float64数组列表（已是float64数组时不复制）"""
+    return [np.asarray(cycle_data, dtype=np.float64).reshape(-1, 2) for cycle_data in cycles_data]
+
+
+def _annotation_text(cycle_results, analyzer, electrode_area):
+    """生成右下角的电容注释文字（cycle_results可为结果列表或_results_to_array得到的结构化数组）"""
     # 获取有效的电容值（排除异常值）
     valid_capacitances = analyzer._get_valid_capacitances(cycle_results)
-    capacitances = [r['capacitance'] for r in cycle_results if r['capacitance'] > 0]
+    if isinstance(cycle_results, np.ndarray):
+        # 结构化数组直接按字段切片，不逐个访问结果字典
+        capacitance = cycle_results['capacitance']
+        capacitances = capacitance[capacitance > 0].tolist()
+    else:
+        capacitances = [r['capacitance'] for r in cycle_results if r['capacitance'] > 0]
+    valid_arr = np.fromiter(valid_capacitances, dtype=np.float64, count=len(valid_capacitances))
     
-    if len(valid_capacitances) > 1:
-        avg_cap = analyzer._calculate_robust_average(valid_capacitances)
-        std_dev = statistics.stdev(valid_capacitances)
-    elif len(valid_capacitances) == 1:
+    if valid_arr.size > 1:
+        avg_cap = analyzer._calculate_robust_average(valid_arr)
+        std_dev = float(valid_arr.std(ddof=1))
+    elif valid_arr.size == 1:
         avg_cap = valid_capacitances[0]
         std_dev = 0
     else:
@@ -154,7 +145,8 @@ def plot_data(figure, canvas, cycles_data, cycle_results, analyzer, electrode_ar
         capacitances,
         analyzer,
         electrode_area,
-        use_specific=(electrode_area is not None and electrode_area > 0)
+        use_specific=(electrode_area is not None and electrode_area > 0),
+        valid_capacitances=valid_capacitances
     )
     
     # 格式化电容值显示
@@ -167,17 +159,117 @@ def plot_data(figure, canvas, cycles_data, cycle_results, analyzer, electrode_ar
     
     # 创建注释文本
     if electrode_area and electrode_area > 0:
-        annotation_text = f'Areal Capacitance = {avg_cap_display:.6g} {cap_display}/cm²\nSD = {std_dev_display:.6g} {cap_display}/cm²'
+        return f'Areal Capacitance = {avg_cap_display:.6g} {cap_display}/cm²\nSD = {std_dev_display:.6g} {cap_display}/cm²'
+    return f'Capacitance = {avg_cap_display:.6g} {cap_display}\nSD = {std_dev_display:.6g} {cap_display}'
+
+
+def plot_data(figure, canvas, cycles_data, cycle_results, analyzer, electrode_area, config=None, artists=None):
+    """
+    绘制V-I曲线图
+    
+    Args:
+        cycle_results: 循环结果列表，或_results_to_array得到的结构化数组
+        artists: 上次plot_data返回的图元字典。循环数和电流单位不变时直接更新曲线数据，
+                 不清空重建整个图表
+    
+    Returns:
+        图元字典（ax、lines、title、xlabel、ylabel、legend、text），供apply_plot_config更新样式
+    """
+    # 一次性解析各项的(字体大小, 字体权重)，之后的样式设置直接使用
+    # config为None时全部使用_STYLE_DEFAULTS中的默认值
+    styles = _get_styles(config or {})
+    
+    # 各循环统一为(N, 2)的float64数组
+    cycle_arrays = _to_soa(cycles_data)
+    
+    # 计算所有数据的最大电流值（单位：A），fmax忽略NaN
+    max_current_A = 0
+    for arr in cycle_arrays:
+        if arr.size:
+            cycle_max = float(np.fmax.reduce(np.abs(arr[:, 1])))
+            if cycle_max > max_current_A:
+                max_current_A = cycle_max
+    
+    # 自动选择单位
+    max_current_nA = max_current_A * 1e9
+    
+    if max_current_nA > 2000:
+        if max_current_nA > 2000 * 1000:
+            scale_factor = 1000  # A to mA
+            unit_str = 'mA'
+        else:
+            scale_factor = 1e6  # A to uA
+            unit_str = 'µA'
     else:
-        annotation_text = f'Capacitance = {avg_cap_display:.6g} {cap_display}\nSD = {std_dev_display:.6g} {cap_display}'
+        scale_factor = 1e9  # A to nA
+        unit_str = 'nA'
+    
+    annotation_text = _annotation_text(cycle_results, analyzer, electrode_area)
+    
+    if (artists is not None and artists['ax'] in figure.axes
+            and len(artists['lines']) == len(cycle_arrays) and artists['unit'] == unit_str):
+        # 图表结构不变：只替换曲线数据和注释文字
+        ax = artists['ax']
+        for line, arr in zip(artists['lines'], cycle_arrays):
+            line.set_data(arr[:, 0], arr[:, 1] * scale_factor)
+        ax.set_autoscale_on(True)
+        ax.relim()
+        ax.autoscale_view()
+        # 坐标轴被复用，需清空工具栏记录的缩放历史，否则"主页"会回到上一组数据的视图
+        if canvas.toolbar is not None:
+            canvas.toolbar.update()
+        artists['text'].set_text(annotation_text)
+        
+        _style_artists(artists, styles)
+        if artists['legend_style'] != styles['legend']:
+            artists['legend'] = _create_legend(ax, *styles['legend'])
+            artists['legend_style'] = styles['legend']
+        
+        figure.tight_layout()
+        canvas.draw()
+        return artists
+    
+    figure.clear()
+    ax = figure.add_subplot(111)
+    
+    # 定义颜色列表（支持更多循环）
+    colors = _cycle_colors(len(cycles_data))
+    
+    # 绘制每个循环的数据
+    # 每个循环保留一条Line2D，不合并为LineCollection：Collection绘制时不做路径简化，
+    # 单循环数万点时绘制反而慢数倍，循环多而点数少时也没有明显提升
+    lines = []
+    for cycle_num, arr in enumerate(cycle_arrays):
+        # 电压列直接使用视图，电流一次向量运算完成单位换算
+        voltages = arr[:, 0]
+        currents = arr[:, 1] * scale_factor
+        
+        line, = ax.plot(voltages, currents, color=colors[cycle_num], 
+                        label=f'Cycle {cycle_num+1}', linewidth=2.0, alpha=0.85, marker=None)
+        lines.append(line)
+    
+    # 设置标签和标题
+    artists = {
+        'ax': ax,
+        'lines': lines,
+        'unit': unit_str,
+        'xlabel': ax.set_xlabel('Voltage (V)', fontname='Times New Roman'),
+        'ylabel': ax.set_ylabel(f'Current ({unit_str})', fontname='Times New Roman'),
+        'title': ax.set_title('CV Test - V-I Curve', fontname='Times New Roman', pad=20),
+    }
+    
+    # 设置图例
+    artists['legend'] = _create_legend(ax, *styles['legend'])
+    artists['legend_style'] = styles['legend']
     
     # 在右下角添加文字注释
-    ax.text(0.98, 0.05, annotation_text, transform=ax.transAxes,
-            fontsize=text_cfg.get('fontsize', 9), 
-            verticalalignment='bottom', horizontalalignment='right',
-            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-            fontname='Times New Roman', 
-            fontweight=_get_font_weight(text_cfg.get('bold', False)))
+    artists['text'] = ax.text(0.98, 0.05, annotation_text, transform=ax.transAxes,
+                              verticalalignment='bottom', horizontalalignment='right',
+                              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+                              fontname='Times New Roman')
+    
+    # 设置标题、标签、刻度和注释文字的字体
+    _style_artists(artists, styles)
     
     # 添加网格
     ax.grid(True, alpha=0.3, linestyle='--')
@@ -186,15 +278,16 @@ def plot_data(figure, canvas, cycles_data, cycle_results, analyzer, electrode_ar
     # 调整布局
     figure.tight_layout()
     canvas.draw()
+    
+    return artists
 
 
-def save_plot_png(figure, file_path, parent_widget, status_bar):
-    """保存图表为PNG格式"""
+def save_plot_png(figure, file_path, parent_widget, status_bar, dpi=300):
+    """保存图表为PNG格式（默认300 DPI，用于打印和论文插图）"""
     if not file_path:
         return
     
-    file_dialog = QFileDialog()
-    output_path, _ = file_dialog.getSaveFileName(
+    output_path, _ = QFileDialog.getSaveFileName(
         parent_widget,
         "保存PNG文件",
         Path(file_path).stem + "_cv_curve.png",
@@ -204,7 +297,8 @@ def save_plot_png(figure, file_path, parent_widget, status_bar):
     if output_path:
         try:
             status_bar.showMessage("正在保存PNG文件...")
-            figure.savefig(output_path, dpi=300, bbox_inches='tight', format='png')
+            figure.savefig(output_path, dpi=dpi, bbox_inches='tight', format='png',
+                           pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
             status_bar.showMessage(f"PNG已保存: {Path(output_path).name}")
             QMessageBox.information(parent_widget, "成功", f"图表已保存为PNG\n{output_path}")
         except Exception as e:
@@ -217,8 +311,7 @@ def save_plot_svg(figure, file_path, parent_widget, status_bar):
     if not file_path:
         return
     
-    file_dialog = QFileDialog()
-    output_path, _ = file_dialog.getSaveFileName(
+    output_path, _ = QFileDialog.getSaveFileName(
         parent_widget,
         "保存SVG文件",
         Path(file_path).stem + "_cv_curve.svg",
@@ -236,28 +329,39 @@ def save_plot_svg(figure, file_path, parent_widget, status_bar):
             status_bar.showMessage("错误：保存SVG失败")
 
 
-def copy_plot_to_clipboard(figure, temp_dir, parent_widget, status_bar):
-    """将图表复制到剪切板"""
+def copy_plot_to_clipboard(figure, parent_widget, status_bar, pixmap=None, dpi=150):
+    """
+    将图表复制到剪切板
+    
+    Args:
+        pixmap: 之前渲染的图像，图表未改变时传入可跳过重新渲染
+        dpi: 渲染分辨率，剪切板一般用于粘贴到文档或聊天软件，默认低于保存PNG的300 DPI
+        
+    Returns:
+        复制到剪切板的QPixmap，失败时返回None
+    """
     try:
         status_bar.showMessage("正在复制图表到剪切板...")
         
-        # 生成临时文件路径
-        temp_image_path = Path(temp_dir) / "cv_curve_temp.png"
-        
-        # 保存为PNG
-        figure.savefig(str(temp_image_path), dpi=300, bbox_inches='tight', format='png')
-        
-        # 加载图片并复制到剪切板
-        image = Image.open(str(temp_image_path))
+        if pixmap is None:
+            # 渲染为内存中的PNG，不经过临时文件
+            buf = io.BytesIO()
+            figure.savefig(buf, dpi=dpi, bbox_inches='tight', format='png',
+                           pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+            
+            pixmap = QPixmap()
+            if not pixmap.loadFromData(buf.getvalue(), 'PNG'):
+                raise ValueError("无法加载渲染的PNG图像")
         
         # 获取系统剪切板
         clipboard = QtApp.clipboard()
-        pixmap = QPixmap(str(temp_image_path))
         clipboard.setPixmap(pixmap)
         
         status_bar.showMessage("图表已复制到剪切板")
         QMessageBox.information(parent_widget, "成功", "图表已复制到剪切板！")
+        return pixmap
         
     except Exception as e:
         QMessageBox.critical(parent_widget, "错误", f"复制到剪切板失败: {str(e)}")
         status_bar.showMessage("错误：复制失败")
+        return None
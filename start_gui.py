@@ -11,15 +11,27 @@ import os
 # 确保当前目录在路径中
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def run_gui():
-    """启动GUI应用"""
+def run_gui(window_class=None):
+    """
+    启动GUI应用
+    
+    Args:
+        window_class: 主窗口类，为None时从cv_gui导入CVAnalysisGUI
+                      （直接运行cv_gui.py时传入该模块中的类，避免cv_gui被再次导入）
+    """
     try:
+        # Qt绑定和插件路径，必须在创建QApplication和导入matplotlib之前设置
+        os.environ['QT_API'] = 'pyside6'
+        os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = ''
         from PySide6.QtWidgets import QApplication
-        from cv_gui import CVAnalysisGUI
         
         print("启动CV数据分析工具...")
         app = QApplication.instance() or QApplication(sys.argv)
-        window = CVAnalysisGUI()
+        
+        # QApplication创建后再导入主窗口（连同分析、绘图模块），缩短启动前的等待
+        if window_class is None:
+            from cv_gui import CVAnalysisGUI as window_class
+        window = window_class()
         window.show()
         
         print("应用已启动，窗口正在显示...")
@@ -5,17 +5,21 @@ UI组件和样式配置
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTableWidget, QTextEdit, QDoubleSpinBox
+    QTableWidget, QTextEdit, QDoubleSpinBox, QHeaderView
 )
 from PySide6.QtGui import QFont
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
 
 
-class NavigationToolbar(NavigationToolbar2QT):
-    """兼容PySide6的NavigationToolbar"""
-    pass
+# 循环结果表格表头字体（需在QApplication创建后才能构造，首次使用时创建）
+_HEADER_FONT = None
+
+
+def _header_font():
+    """获取循环结果表格的表头字体"""
+    global _HEADER_FONT
+    if _HEADER_FONT is None:
+        _HEADER_FONT = QFont("Arial", 12, QFont.Bold)
+    return _HEADER_FONT
 
 
 def get_application_stylesheet():
@@ -47,6 +51,36 @@ def get_application_stylesheet():
         QLabel {
             color: #333;
         }
+        
+        /* 主窗口各控件的字体（按objectName区分），由样式表统一解析，
+           不再为每个控件单独创建QFont；未命名的控件（如对话框）不受影响 */
+        QLabel#fieldLabel, QPushButton#loadButton,
+        QDoubleSpinBox#areaInput, QTableWidget#cyclesTable,
+        QTableWidget#cyclesTable QHeaderView {
+            font-family: Arial;
+            font-size: 12pt;
+        }
+        QLabel#currentFileLabel {
+            font-family: Arial;
+            font-size: 13pt;
+        }
+        QLabel#sectionTitle {
+            font-family: Arial;
+            font-size: 13pt;
+            font-weight: bold;
+        }
+        QLabel#sectionSubtitle {
+            font-family: Arial;
+            font-size: 11pt;
+        }
+        QPushButton#saveButton {
+            font-family: Arial;
+            font-size: 10pt;
+        }
+        QTextEdit#resultText {
+            font-family: Courier;
+            font-size: 12pt;
+        }
     """
 
 
@@ -55,20 +89,20 @@ def create_file_selection_layout():
     file_layout = QHBoxLayout()
     
     file_label = QLabel("文件: ")
-    file_label.setFont(QFont("Arial", 12))
+    file_label.setObjectName("fieldLabel")
     
     current_file_label = QLabel("未选择文件")
-    current_file_label.setFont(QFont("Arial", 13))
+    current_file_label.setObjectName("currentFileLabel")
     
     load_btn = QPushButton("导入CV数据文件")
-    load_btn.setFont(QFont("Arial", 12))
+    load_btn.setObjectName("loadButton")
     load_btn.setMinimumWidth(150)
     
     area_label = QLabel("电极面积 (cm²):")
-    area_label.setFont(QFont("Arial", 12))
+    area_label.setObjectName("fieldLabel")
     
     area_input = QDoubleSpinBox()
-    area_input.setFont(QFont("Arial", 12))
+    area_input.setObjectName("areaInput")
     area_input.setMinimum(0)
     area_input.setMaximum(10000)
     area_input.setSingleStep(0.001)
@@ -87,23 +121,34 @@ def create_file_selection_layout():
     return file_layout, current_file_label, load_btn, area_input
 
 
+# 循环结果表格的列宽：循环、面积、电容/单位面积容、备注
+_CYCLES_TABLE_COLUMN_WIDTHS = (60, 110, 180, 90)
+
+
 def create_cycles_table():
     """创建循环结果表格"""
     cycles_table = QTableWidget()
     cycles_table.setColumnCount(4)
     cycles_table.setHorizontalHeaderLabels(["循环", "面积 (C)", "电容 (mF)", "备注"])
-    cycles_table.setFont(QFont("Arial", 12))
-    cycles_table.horizontalHeader().setFont(QFont("Arial", 12, QFont.Bold))
+    cycles_table.setObjectName("cyclesTable")
+    cycles_table.horizontalHeader().setFont(_header_font())
     cycles_table.setMaximumWidth(500)
     cycles_table.verticalHeader().setDefaultSectionSize(32)
     
+    # 各列内容的格式固定，直接使用固定列宽，刷新表格时无需按内容重新计算
+    header = cycles_table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    for col, width in enumerate(_CYCLES_TABLE_COLUMN_WIDTHS):
+        cycles_table.setColumnWidth(col, width)
+    header.setStretchLastSection(True)
+    
     return cycles_table
 
 
 def create_result_text_widget():
     """创建结果文本显示区域"""
     result_text = QTextEdit()
-    result_text.setFont(QFont("Courier", 12))
+    result_text.setObjectName("resultText")
     result_text.setReadOnly(True)
     result_text.setMaximumWidth(500)
     result_text.setMaximumHeight(350)
@@ -113,6 +158,11 @@ def create_result_text_widget():
 
 def create_matplotlib_canvas():
     """创建matplotlib图表画布"""
+    # matplotlib在首次创建画布时才导入
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+    
     figure = Figure(figsize=(8, 6), dpi=100)
     canvas = FigureCanvas(figure)
     
@@ -137,17 +187,17 @@ def create_left_panel_layout(cycles_table, result_text):
     left_layout = QVBoxLayout()
     
     title1 = QLabel("各循环电容值结果:")
-    title1.setFont(QFont("Arial", 13, QFont.Bold))
+    title1.setObjectName("sectionTitle")
     left_layout.addWidget(title1)
     
     subtitle1 = QLabel("(每行代表一轮循环，2 Segments)")
-    subtitle1.setFont(QFont("Arial", 11))
+    subtitle1.setObjectName("sectionSubtitle")
     left_layout.addWidget(subtitle1)
     
     left_layout.addWidget(cycles_table)
     
     title2 = QLabel("\n最终结果:")
-    title2.setFont(QFont("Arial", 13, QFont.Bold))
+    title2.setObjectName("sectionTitle")
     left_layout.addWidget(title2)
     
     left_layout.addWidget(result_text)
@@ -160,7 +210,7 @@ def create_right_panel_layout(canvas_widget):
     right_layout = QVBoxLayout()
     
     graph_label = QLabel("V-I曲线图:")
-    graph_label.setFont(QFont("Arial", 13, QFont.Bold))
+    graph_label.setObjectName("sectionTitle")
     right_layout.addWidget(graph_label)
     
     right_layout.addWidget(canvas_widget)
@@ -173,15 +223,15 @@ def create_save_buttons_layout():
     save_layout = QHBoxLayout()
     
     save_png_btn = QPushButton("保存为PNG")
-    save_png_btn.setFont(QFont("Arial", 10))
+    save_png_btn.setObjectName("saveButton")
     save_png_btn.setEnabled(False)
     
     save_svg_btn = QPushButton("保存为SVG")
-    save_svg_btn.setFont(QFont("Arial", 10))
+    save_svg_btn.setObjectName("saveButton")
     save_svg_btn.setEnabled(False)
     
     copy_clipboard_btn = QPushButton("复制到剪切板")
-    copy_clipboard_btn.setFont(QFont("Arial", 10))
+    copy_clipboard_btn.setObjectName("saveButton")
     copy_clipboard_btn.setEnabled(False)
     
     save_layout.addStretch()